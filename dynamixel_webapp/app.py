@@ -1,24 +1,119 @@
+# eventlet must monkey-patch the stdlib before anything else imports it.
+# Only the networking primitives are patched: threads and locks stay
+# real, because blocking serial I/O is pushed to OS threads via
+# eventlet.tpool instead of being greened.
+try:
+    import eventlet
+    eventlet.monkey_patch(socket=True, select=True, time=True, thread=False, os=False)
+except ImportError:
+    # Fall back to one thread per client with blocking sends.
+    eventlet = None
+
 import atexit
+import logging
+import logging.handlers
 import time
+from queue import SimpleQueue
 from threading import Lock
 from flask import Flask, render_template, send_from_directory
 from flask_socketio import SocketIO, emit
 from serial.tools import list_ports
 from dynamixel_sdk import PortHandler, PacketHandler, COMM_SUCCESS
-from config import TELEMETRY_DT, DEFAULT_BAUDRATE, SCAN_ID_MIN, SCAN_ID_MAX
+from config import (
+    TELEMETRY_DT,
+    TELEMETRY_BATCH,
+    TELEMETRY_DT_MAX,
+    DEFAULT_BAUDRATE,
+    SCAN_ID_MIN,
+    SCAN_ID_MAX,
+)
 from dynamixel_controller import DynamixelController, DynamixelError
 
+try:
+    import msgpack
+except ImportError:
+    # Fall back to per-tick JSON "telemetry" emits.
+    msgpack = None
+
+try:
+    import orjson
+except ImportError:
+    # Fall back to the stdlib json module.
+    orjson = None
+
+
+class _OrjsonModule:
+    """Module-like dumps/loads shim so Socket.IO can encode with orjson."""
+
+    @staticmethod
+    def dumps(obj, **kwargs):
+        # Telemetry dicts are keyed by int servo ID; without this option
+        # orjson raises TypeError and kills the emitting task.
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+
+    @staticmethod
+    def loads(data, **kwargs):
+        return orjson.loads(data)
+
+
+def _setup_logging():
+    """Route log records through a queue to a background writer thread.
+
+    print()/StreamHandler block the emitting thread on the stdout lock
+    (and on slow terminals or pipes), which interacts badly with the
+    serial hot path during telemetry-driven reconnects. QueueHandler
+    returns immediately; the QueueListener does the actual writes.
+    """
+    log_queue = SimpleQueue()
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter("[%(levelname)s] %(message)s"))
+    listener = logging.handlers.QueueListener(log_queue, stream_handler)
+    listener.start()
+    root = logging.getLogger()
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+    root.setLevel(logging.INFO)
+    return listener
+
+
+_log_listener = _setup_logging()
+logger = logging.getLogger("dxl.app")
+
 # Flask setup
 app = Flask(
     __name__,
     static_folder="frontend/static",
     template_folder="frontend",
 )
-socketio = SocketIO(app, cors_allowed_origins="*", async_mode="threading")
+_socketio_kwargs = {}
+if orjson is not None:
+    _socketio_kwargs["json"] = _OrjsonModule()
+socketio = SocketIO(
+    app,
+    cors_allowed_origins="*",
+    async_mode="eventlet" if eventlet is not None else "threading",
+    **_socketio_kwargs,
+)
 
-# Dynamixel controller 
+
+def run_blocking(call, *args, **kwargs):
+    """Run a blocking serial call without stalling the eventlet reactor.
+
+    Under eventlet the greenlet serving Socket.IO must not block on
+    serial syscalls; tpool hands them to an OS thread and yields until
+    they finish. Under threading mode this is a plain call.
+    """
+    if eventlet is not None:
+        return eventlet.tpool.execute(call, *args, **kwargs)
+    return call(*args, **kwargs)
+
+# Dynamixel controller
+# Reading/assigning the reference is GIL-atomic, so readers (telemetry
+# loop, Socket.IO handlers) take a plain snapshot without locking.
 dxl = None
-dxl_lock = Lock()
+# Serializes connect/disconnect against each other only; never taken by
+# readers, so blocking openPort()/closePort() syscalls cannot stall the
+# telemetry thread.
+dxl_swap_lock = Lock()
 connection_info = {
     "port": None,
     "baudrate": None,
@@ -28,6 +123,11 @@ dxl_error_message = None
 
 telemetry_thread = None
 telemetry_thread_lock = Lock()
+# Dedup key of the last emitted sample. Telemetry is the UI's only
+# source of servo state, so resetting this to None forces the next
+# sample out even if nothing changed (e.g. for a freshly connected
+# client while the bench is idle).
+telemetry_last_key = None
 running = True
 
 
@@ -43,18 +143,85 @@ def static_proxy(path):
 
 # Telemetry logging
 
+def _soa_sample_key(data):
+    """Comparable dedup key for a struct-of-arrays sample.
+
+    Covers every field the UI renders, not just the motion triple --
+    otherwise a torque toggle or mode switch on a stationary servo
+    would be suppressed as "unchanged".
+    """
+    if "error" in data:
+        return None  # errors are always re-emitted
+    return (
+        data.get("pos"),
+        data.get("vel"),
+        data.get("cur"),
+        data.get("moving"),
+        data.get("mode"),
+        data.get("torque"),
+    )
+
+
+def _dict_sample_key(data):
+    """Comparable dedup key for a per-ID dict sample (same fields as SoA)."""
+    key = []
+    for dxl_id, state in data.items():
+        if "error" in state:
+            return None
+        key.append(
+            (
+                dxl_id,
+                state.get("present_position"),
+                state.get("present_velocity"),
+                state.get("present_current"),
+                state.get("moving"),
+                state.get("operating_mode"),
+                state.get("torque_enabled"),
+            )
+        )
+    return tuple(key)
+
+
 def telemetry_loop():
-    global running
+    global running, telemetry_last_key
+    # Batching several samples per emit amortizes serialization and
+    # WebSocket frame overhead; msgpack keeps the payload binary.
+    batch = []
+    sleep_dt = TELEMETRY_DT
     while running:
         timestamp = time.time()
-        with dxl_lock:
-            controller = dxl
-        if controller is not None:
-            data = controller.read_all_states()
+        controller = dxl  # atomic snapshot of the current controller
+        if msgpack is None:
+            # JSON fallback keeps the per-ID dict view (bytes do not
+            # serialize as JSON).
+            data = run_blocking(controller.read_all) if controller is not None else {}
+            key = _dict_sample_key(data)
+        else:
+            data = run_blocking(controller.read_all_states) if controller is not None else {}
+            key = _soa_sample_key(data)
+        changed = key is None or key != telemetry_last_key
+        telemetry_last_key = key
+        if changed:
+            sleep_dt = TELEMETRY_DT
+            if msgpack is None:
+                socketio.emit("telemetry", {"timestamp": timestamp, "servos": data})
+            else:
+                batch.append({"t": timestamp, "s": data})
+                if len(batch) >= TELEMETRY_BATCH:
+                    socketio.emit("telemetry_batch", msgpack.packb(batch))
+                    batch.clear()
         else:
-            data = {}
-        socketio.emit("telemetry", {"timestamp": timestamp, "servos": data})
-        socketio.sleep(TELEMETRY_DT)
+            # Polling faster than the servo's internal update rate just
+            # returns the same sample; skip the emit and back off until
+            # something moves, then snap back to full rate.
+            # First flush any partial batch: once dedup kicks in the
+            # batch stops filling, and the last changed samples (the
+            # final resting position) would otherwise be stranded.
+            if msgpack is not None and batch:
+                socketio.emit("telemetry_batch", msgpack.packb(batch))
+                batch.clear()
+            sleep_dt = min(sleep_dt * 2, TELEMETRY_DT_MAX)
+        socketio.sleep(sleep_dt)
 
 
 def ensure_telemetry_thread():
@@ -64,66 +231,103 @@ def ensure_telemetry_thread():
             telemetry_thread = socketio.start_background_task(telemetry_loop)
 
 
-def get_serial_ports():
-    ports = []
-    for p in list_ports.comports():
-        ports.append(
-            {
-                "device": p.device,
-                "description": p.description,
-            }
-        )
-    return ports
+# comports() walks /sys on Linux and the SetupAPI registry on Windows
+# (~10 ms); chatty UIs request the list per click, so cache it briefly.
+PORTS_CACHE_TTL = 1.0
+_ports_cache = []
+_ports_cache_ts = 0.0
+
+
+def invalidate_serial_ports_cache():
+    global _ports_cache_ts
+    _ports_cache_ts = 0.0
+
+
+def get_serial_ports(force=False):
+    global _ports_cache, _ports_cache_ts
+    now = time.monotonic()
+    if force or now - _ports_cache_ts > PORTS_CACHE_TTL:
+        ports = []
+        for p in list_ports.comports():
+            ports.append(
+                {
+                    "device": p.device,
+                    "description": p.description,
+                }
+            )
+        _ports_cache = ports
+        _ports_cache_ts = now
+    return _ports_cache
 
 
 def connect_controller(port: str, baudrate: int, ids):
     global dxl, dxl_error_message, connection_info
     ids = [int(i) for i in ids]
-    with dxl_lock:
-        # Close previous controller if any
-        if dxl is not None:
+    with dxl_swap_lock:
+        old = dxl
+        if old is not None and old.port_name == port:
+            # Reconnecting to the same device: release it before reopening.
+            dxl = None
             try:
-                dxl.close()
+                old.close()
             except Exception:
                 pass
-            dxl = None
+            old = None
         try:
+            # Built without publishing the reference, so the telemetry
+            # loop keeps running against the old controller meanwhile.
             controller = DynamixelController(ids=ids, port=port, baudrate=baudrate)
-            dxl = controller
-            connection_info = {
-                "port": port,
-                "baudrate": baudrate,
-                "ids": ids,
-            }
-            dxl_error_message = None
-            print(f"[INFO] Connected to DXL on {port} @ {baudrate}, IDs={ids}")
-            return True, "Connected successfully."
         except Exception as e:
             dxl = None
             dxl_error_message = str(e)
-            print(f"[ERROR] Failed to connect: {e}")
+            logger.error("Failed to connect: %s", e)
+            if old is not None:
+                try:
+                    old.close()
+                except Exception:
+                    pass
             return False, f"Failed to connect: {e}"
+        dxl = controller  # atomic swap
+        connection_info = {
+            "port": port,
+            "baudrate": baudrate,
+            "ids": ids,
+        }
+        dxl_error_message = None
+        logger.info("Connected to DXL on %s @ %s, IDs=%s", port, baudrate, ids)
+        if old is not None:
+            # Close only after the swap so readers never see a closed port.
+            try:
+                old.close()
+            except Exception:
+                pass
+        return True, "Connected successfully."
 
 
 def disconnect_controller():
     global dxl, connection_info
-    with dxl_lock:
-        if dxl is not None:
-            try:
-                dxl.close()
-            except Exception:
-                pass
-            dxl = None
+    with dxl_swap_lock:
+        old = dxl
+        dxl = None  # atomic swap
         connection_info = {"port": None, "baudrate": None, "ids": []}
-    print("[INFO] Disconnected from DXL")
+    if old is not None:
+        try:
+            old.close()
+        except Exception:
+            pass
+    logger.info("Disconnected from DXL")
 
 
 # Socket.IO (DO NOT CHANGE ANYTHING HERE!)
 
 @socketio.on("connect")
 def handle_connect():
-    print("[INFO] Client connected")
+    global telemetry_last_key
+    logger.info("Client connected")
     ensure_telemetry_thread()
+    # Force the next sample past dedup so the new client gets current
+    # servo state immediately instead of waiting for something to move.
+    telemetry_last_key = None
     emit("serial_ports", {"ports": get_serial_ports()})
     emit(
         "connect_result",
@@ -140,12 +344,13 @@ def handle_connect():
 
 @socketio.on("disconnect")
 def handle_disconnect():
-    print("[INFO] Client disconnected")
+    logger.info("Client disconnected")
 
 
 @socketio.on("list_serial_ports")
 def handle_list_serial_ports():
-    emit("serial_ports", {"ports": get_serial_ports()})
+    # Explicit refresh from the UI always re-enumerates.
+    emit("serial_ports", {"ports": get_serial_ports(force=True)})
 
 
 @socketio.on("scan_servos")
@@ -174,29 +379,44 @@ def handle_scan_servos(message):
     packet_handler = PacketHandler(2.0)
 
     try:
-        if not port_handler.openPort():
+        if not run_blocking(port_handler.openPort):
             emit(
                 "scan_result",
                 {"ok": False, "message": f"Failed to open port {port}", "ids": []},
             )
             return
 
-        if not port_handler.setBaudRate(baudrate):
+        if not run_blocking(port_handler.setBaudRate, baudrate):
             emit(
                 "scan_result",
                 {"ok": False, "message": f"Failed to set baudrate {baudrate}", "ids": []},
             )
             return
 
-        for dxl_id in range(id_min, id_max + 1):
-            try:
-                model_number, dxl_comm_result, dxl_error = packet_handler.ping(
-                    port_handler, dxl_id
-                )
-                if dxl_comm_result == COMM_SUCCESS and dxl_error == 0:
-                    found_ids.append(int(dxl_id))
-            except Exception:
-                continue
+        # Protocol 2.0 broadcast ping: one TX and a burst of replies,
+        # instead of one blocking round-trip per candidate ID.
+        try:
+            ping_results, dxl_comm_result = run_blocking(
+                packet_handler.broadcastPing, port_handler
+            )
+        except Exception:
+            ping_results, dxl_comm_result = {}, None
+        if dxl_comm_result == COMM_SUCCESS:
+            found_ids = sorted(
+                int(dxl_id) for dxl_id in ping_results if id_min <= dxl_id <= id_max
+            )
+        else:
+            # Fallback: sequential scan (protocol 1 devices only answer
+            # individual pings).
+            for dxl_id in range(id_min, id_max + 1):
+                try:
+                    model_number, dxl_comm_result, dxl_error = run_blocking(
+                        packet_handler.ping, port_handler, dxl_id
+                    )
+                    if dxl_comm_result == COMM_SUCCESS and dxl_error == 0:
+                        found_ids.append(int(dxl_id))
+                except Exception:
+                    continue
 
         msg = (
             f"Found IDs: {found_ids}"
@@ -217,7 +437,7 @@ def handle_scan_servos(message):
         )
     finally:
         try:
-            port_handler.closePort()
+            run_blocking(port_handler.closePort)
         except Exception:
             pass
 
@@ -255,7 +475,9 @@ def handle_connect_servos(message):
     except (TypeError, ValueError):
         baudrate = DEFAULT_BAUDRATE
 
-    ok, msg = connect_controller(port, baudrate, ids)
+    ok, msg = run_blocking(connect_controller, port, baudrate, ids)
+    # Adapters may appear/disappear around a (re)connect.
+    invalidate_serial_ports_cache()
     emit(
         "connect_result",
         {
@@ -271,7 +493,10 @@ def handle_connect_servos(message):
 
 @socketio.on("disconnect_servos")
 def handle_disconnect_servos():
-    disconnect_controller()
+    # close() joins the IO worker and closes the port; keep that off the
+    # serving greenlet like every other serial call.
+    run_blocking(disconnect_controller)
+    invalidate_serial_ports_cache()
     emit(
         "connect_result",
         {
@@ -285,9 +510,7 @@ def handle_disconnect_servos():
 
 @socketio.on("set_operating_mode")
 def handle_set_operating_mode(message):
-    global dxl
-    with dxl_lock:
-        controller = dxl
+    controller = dxl  # atomic snapshot of the current controller
 
     if controller is None:
         emit("backend_error", {"message": "Not connected to any Dynamixel bus."})
@@ -298,7 +521,7 @@ def handle_set_operating_mode(message):
     auto_torque = bool(message.get("autoTorque", True))
 
     try:
-        controller.set_operating_mode(dxl_id, mode, auto_torque=auto_torque)
+        run_blocking(controller.set_operating_mode, dxl_id, mode, auto_torque=auto_torque)
         emit("log", {"level": "info", "message": f"ID {dxl_id}: set operating mode to {mode}"})
     except (ValueError, DynamixelError) as e:
         emit("log", {"level": "error", "message": f"Failed to set operating mode on ID {dxl_id}: {e}"})
@@ -306,9 +529,7 @@ def handle_set_operating_mode(message):
 
 @socketio.on("set_torque")
 def handle_set_torque(message):
-    global dxl
-    with dxl_lock:
-        controller = dxl
+    controller = dxl  # atomic snapshot of the current controller
 
     if controller is None:
         emit("backend_error", {"message": "Not connected to any Dynamixel bus."})
@@ -318,7 +539,7 @@ def handle_set_torque(message):
     enable = bool(message.get("enable"))
 
     try:
-        controller.set_torque(dxl_id, enable)
+        run_blocking(controller.set_torque, dxl_id, enable)
         emit("log", {"level": "info", "message": f"ID {dxl_id}: torque {'ON' if enable else 'OFF'}"})
     except DynamixelError as e:
         emit("log", {"level": "error", "message": f"Failed to set torque on ID {dxl_id}: {e}"})
@@ -326,9 +547,7 @@ def handle_set_torque(message):
 
 @socketio.on("set_pid")
 def handle_set_pid(message):
-    global dxl
-    with dxl_lock:
-        controller = dxl
+    controller = dxl  # atomic snapshot of the current controller
 
     if controller is None:
         emit("backend_error", {"message": "Not connected to any Dynamixel bus."})
@@ -343,8 +562,8 @@ def handle_set_pid(message):
     v_i = int(message.get("velocityI", 0))
 
     try:
-        controller.set_position_pid_gains(dxl_id, p_p, p_i, p_d)
-        controller.set_velocity_pi_gains(dxl_id, v_p, v_i)
+        run_blocking(controller.set_position_pid_gains, dxl_id, p_p, p_i, p_d)
+        run_blocking(controller.set_velocity_pi_gains, dxl_id, v_p, v_i)
         emit("log", {"level": "info", "message": f"ID {dxl_id}: updated PID gains"})
     except DynamixelError as e:
         emit("log", {"level": "error", "message": f"Failed to set PID gains on ID {dxl_id}: {e}"})
@@ -352,9 +571,7 @@ def handle_set_pid(message):
 
 @socketio.on("set_goals")
 def handle_set_goals(message):
-    global dxl
-    with dxl_lock:
-        controller = dxl
+    controller = dxl  # atomic snapshot of the current controller
 
     if controller is None:
         emit("backend_error", {"message": "Not connected to any Dynamixel bus."})
@@ -378,19 +595,42 @@ def handle_set_goals(message):
     )
 
     try:
-        controller.set_goals(dxl_id, **kwargs)
+        run_blocking(controller.set_goals, dxl_id, **kwargs)
         emit("log", {"level": "info", "message": f"ID {dxl_id}: updated goals {kwargs}"})
     except DynamixelError as e:
         emit("log", {"level": "error", "message": f"Failed to set goals on ID {dxl_id}: {e}"})
 
 
+@socketio.on("set_goals_bulk")
+def handle_set_goals_bulk(message):
+    controller = dxl  # atomic snapshot of the current controller
+
+    if controller is None:
+        emit("backend_error", {"message": "Not connected to any Dynamixel bus."})
+        return
+
+    goals = message.get("goals") or {}
+    try:
+        goal_positions = {int(dxl_id): int(pos) for dxl_id, pos in goals.items()}
+    except (TypeError, ValueError, AttributeError):
+        emit("log", {"level": "error", "message": f"Invalid bulk goals payload: {goals}"})
+        return
+
+    try:
+        # No success log: this path is meant to stream at trajectory rate.
+        run_blocking(controller.sync_set_goal_positions, goal_positions)
+    except DynamixelError as e:
+        emit("log", {"level": "error", "message": f"Failed to set bulk goals: {e}"})
+
+
 # Clean up
 @atexit.register
 def shutdown():
     global running
     running = False
     disconnect_controller()
+    _log_listener.stop()  # flush queued records before exit
 
 if __name__ == "__main__":
-    print("[INFO] Starting Flask-SocketIO server on http://127.0.0.1:5000")
+    logger.info("Starting Flask-SocketIO server on http://127.0.0.1:5000")
     socketio.run(app, host="0.0.0.0", port=5000)
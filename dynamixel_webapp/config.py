@@ -3,5 +3,12 @@ DEFAULT_BAUDRATE = 57600
 SCAN_ID_MIN = 1
 SCAN_ID_MAX = 10
 
-# Telemetry update 
+# Telemetry update
 TELEMETRY_DT = 0.05  # 20 Hz
+# Samples buffered per "telemetry_batch" emit; worst-case added UI latency
+# is TELEMETRY_BATCH * TELEMETRY_DT.
+TELEMETRY_BATCH = 4
+# When consecutive samples are identical (servo internal update rate is
+# slower than the poll rate, or the bench is idle) the loop backs off,
+# doubling its sleep up to this ceiling.
+TELEMETRY_DT_MAX = 0.2
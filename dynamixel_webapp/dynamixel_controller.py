@@ -1,9 +1,77 @@
+import logging
+import os
+import queue
+import struct
 import threading
 import time
+from concurrent.futures import Future, TimeoutError as FutureTimeout
 from typing import Dict, Any, List, Optional
-from dynamixel_sdk import PortHandler, PacketHandler, COMM_SUCCESS
+from dynamixel_sdk import (
+    PortHandler,
+    PacketHandler,
+    GroupSyncRead,
+    GroupSyncWrite,
+    COMM_SUCCESS,
+)
 from config import DEFAULT_BAUDRATE
 
+logger = logging.getLogger("dxl")
+
+# CRC-16/BUYPASS is the CRC used by Dynamixel Protocol 2.0. Prefer
+# fastcrc (Rust extension, SIMD folding where the CPU supports it), then
+# crcmod's C extension, then the pure-Python table below.
+try:
+    from fastcrc import crc16 as _fastcrc16_mod
+    # fastcrc names the algorithm "umts" (an alias of BUYPASS); older
+    # releases may expose "buypass" directly.
+    _fastcrc16 = getattr(_fastcrc16_mod, "buypass", None) or getattr(
+        _fastcrc16_mod, "umts", None
+    )
+except ImportError:
+    _fastcrc16 = None
+
+try:
+    import crcmod.predefined
+    _crc16 = crcmod.predefined.mkPredefinedCrcFun("crc-16-buypass")
+except ImportError:
+    _crc16 = None
+
+
+def _build_crc_table():
+    # Same table the SDK uses (polynomial 0x8005, non-reflected), built
+    # once at import instead of as a list literal inside every call.
+    table = []
+    for byte in range(256):
+        crc = byte << 8
+        for _ in range(8):
+            if crc & 0x8000:
+                crc = ((crc << 1) ^ 0x8005) & 0xFFFF
+            else:
+                crc = (crc << 1) & 0xFFFF
+        table.append(crc)
+    return table
+
+
+_CRC_TABLE = _build_crc_table()
+
+
+def _fast_update_crc(crc_accum, data_blk_ptr, data_blk_size):
+    """Drop-in replacement for PacketHandler.updateCRC.
+
+    The SDK rebuilds its 256-entry CRC table as a list literal on every
+    call, which dominates packet assembly cost. This uses fastcrc or
+    crcmod when installed, falling back to the module-level table.
+    """
+    if _fastcrc16 is not None:
+        return _fastcrc16(bytes(data_blk_ptr[:data_blk_size]), crc_accum)
+    if _crc16 is not None:
+        return _crc16(bytes(data_blk_ptr[:data_blk_size]), crc_accum)
+    table = _CRC_TABLE
+    for j in range(data_blk_size):
+        i = ((crc_accum >> 8) ^ data_blk_ptr[j]) & 0xFF
+        crc_accum = ((crc_accum << 8) ^ table[i]) & 0xFFFF
+    return crc_accum
+
 # Control table addresses for X-series / XC330-M288-T
 ADDR_OPERATING_MODE = 11
 ADDR_TORQUE_ENABLE = 64
@@ -23,6 +91,27 @@ ADDR_PRESENT_CURRENT = 126
 ADDR_PRESENT_VELOCITY = 128
 ADDR_PRESENT_POSITION = 132
 ADDR_MOVING = 122
+# Contiguous telemetry block: Moving (122) .. Present Position (132..135)
+SYNC_READ_START = ADDR_MOVING
+SYNC_READ_LENGTH = 14
+# Block layout: Moving, Moving Status, Present PWM, Present Current,
+# Present Velocity, Present Position.
+_TELEM_BLOCK = struct.Struct("<BBhhii")
+
+_INT16 = struct.Struct("<h")
+_UINT16 = struct.Struct("<H")
+_INT32 = struct.Struct("<i")
+_UINT32 = struct.Struct("<I")
+
+
+def _to_int16(value: int) -> int:
+    """Branchless two's-complement cast of a raw 16-bit register value."""
+    return _INT16.unpack(_UINT16.pack(value & 0xFFFF))[0]
+
+
+def _to_int32(value: int) -> int:
+    """Branchless two's-complement cast of a raw 32-bit register value."""
+    return _INT32.unpack(_UINT32.pack(value & 0xFFFFFFFF))[0]
 OPERATING_MODE_NAMES = {
     0: "Current Control Mode",
     1: "Velocity Control Mode",
@@ -44,28 +133,186 @@ class DynamixelController:
         self.ids = list(ids)
         self.port_handler = PortHandler(port)
         self.packet_handler = PacketHandler(2.0)
-        self.lock = threading.Lock()
+        # Shadow the SDK's per-call table rebuild on this instance; the
+        # signature matches, so TX assembly and RX verification both use it.
+        self.packet_handler.updateCRC = _fast_update_crc
 
         if not self.port_handler.openPort():
             raise DynamixelError(f"Failed to open port {port}")
         if not self.port_handler.setBaudRate(baudrate):
+            self.port_handler.closePort()
             raise DynamixelError(f"Failed to set baudrate {baudrate} on {port}")
+        self._enable_low_latency()
+        self._tune_serial_reads()
+
+        # All serial I/O funnels through one worker thread: the queue
+        # enforces bus ordering, so the byte-level ops need no per-call
+        # lock (and its two syscalls per acquire/release on the hot path).
+        # Started only once the port is open and configured, so a failed
+        # constructor never leaves the worker parked on queue.get().
+        self._closed = False
+        self._io_queue: "queue.Queue" = queue.Queue()
+        self._io_thread = threading.Thread(
+            target=self._io_worker, name=f"dxl-io-{port}", daemon=True
+        )
+        self._io_thread.start()
 
-        print(f"[INFO] Opened Dynamixel port {port} @ {baudrate}")
+        logger.info("Opened Dynamixel port %s @ %s", port, baudrate)
         for dxl_id in self.ids:
             try:
                 model = self.get_model_number(dxl_id)
-                print(f"[INFO] ID {dxl_id} model number: {model}")
+                logger.info("ID %d model number: %d", dxl_id, model)
             except DynamixelError as exc:
-                print(f"[ERROR] Failed to ping ID {dxl_id}: {exc}")
+                logger.error("Failed to ping ID %d: %s", dxl_id, exc)
+
+        # One sync read covers the whole telemetry block for every servo,
+        # so each telemetry tick costs a single bus transaction.
+        self.sync_read = GroupSyncRead(
+            self.port_handler, self.packet_handler, SYNC_READ_START, SYNC_READ_LENGTH
+        )
+        for dxl_id in self.ids:
+            self.sync_read.addParam(dxl_id)
+
+        # One SyncWrite covers goal positions for every servo, so a
+        # trajectory tick costs a single instruction packet.
+        self.sync_write = GroupSyncWrite(
+            self.port_handler, self.packet_handler, ADDR_GOAL_POSITION, 4
+        )
+
+        # Struct-of-arrays telemetry buffers, one slot per servo, filled in
+        # place after each sync read so the hot path allocates no per-tick
+        # dicts. Values are packed little-endian as the servo sends them;
+        # consumers apply signedness by reading int16/int32 views.
+        n = len(self.ids)
+        self._ok_buf = bytearray(n)
+        self._pos_buf = bytearray(4 * n)
+        self._vel_buf = bytearray(4 * n)
+        self._cur_buf = bytearray(2 * n)
+        self._pwm_buf = bytearray(2 * n)
+        self._moving_buf = bytearray(n)
+        self._mode_buf = bytearray(n)
+        self._torque_buf = bytearray(n)
+
+        # Operating mode and torque only change on explicit writes, so cache
+        # them here instead of re-reading them from the bus every tick.
+        self._mode_cache: Dict[int, int] = {}
+        self._torque_cache: Dict[int, bool] = {}
+        # Mode value -> display name, so the hot path never rebuilds the
+        # fallback f-string for unknown modes.
+        self._mode_name_cache: Dict[int, str] = {}
+        for dxl_id in self.ids:
+            try:
+                self._mode_cache[dxl_id] = self._read1(dxl_id, ADDR_OPERATING_MODE)
+                self._torque_cache[dxl_id] = bool(
+                    self._read1(dxl_id, ADDR_TORQUE_ENABLE)
+                )
+            except DynamixelError:
+                pass
+
+    def _enable_low_latency(self):
+        """Reduce the USB-serial latency timer (FTDI adapters default to 16 ms).
+
+        Every TxRx round-trip is padded to the adapter's latency timer, so
+        the default caps the bus at ~60 transactions/s regardless of
+        baudrate. Best effort: ports that do not support it stay unchanged.
+        """
+        try:
+            # pyserial wraps the TIOCSSERIAL / ASYNC_LOW_LATENCY ioctl
+            self.port_handler.ser.set_low_latency_mode(True)
+            return
+        except (AttributeError, NotImplementedError, ValueError, OSError):
+            pass
+        # Fallback: sysfs knob exposed by FTDI-style usb-serial drivers
+        tty = os.path.basename(self.port_name)
+        try:
+            with open(f"/sys/bus/usb-serial/devices/{tty}/latency_timer", "w") as f:
+                f.write("1")
+        except OSError:
+            # Not an FTDI-style adapter, or no permission; keep the default.
+            pass
+
+    # Serial IO worker
+
+    def _io_worker(self):
+        while True:
+            item = self._io_queue.get()
+            if item is None:
+                break
+            call, args, kwargs, future = item
+            waiters = [future]
+            if call == self._sync_write_positions_io:
+                # Goal streaming faster than the bus piles up sync writes
+                # behind the transaction on the wire. Only the newest
+                # target per servo matters, so merge queued goal sets into
+                # this packet instead of sending each superseded one.
+                # (Producers block on their future, so simultaneously
+                # queued items always come from independent callers.)
+                goals = dict(args[0])
+                while True:
+                    try:
+                        nxt = self._io_queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    if nxt is not None and nxt[0] == self._sync_write_positions_io:
+                        goals.update(nxt[1][0])
+                        waiters.append(nxt[3])
+                        continue
+                    # Not coalescible; run it after this transaction.
+                    self._io_queue.put(nxt)
+                    break
+                args = (goals,)
+            try:
+                result = call(*args, **kwargs)
+            except BaseException as exc:
+                for waiter in waiters:
+                    waiter.set_exception(exc)
+            else:
+                for waiter in waiters:
+                    waiter.set_result(result)
+        # Fail anything still queued once shutdown has started.
+        while True:
+            try:
+                item = self._io_queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is not None:
+                item[3].set_exception(DynamixelError("Controller is closed"))
+
+    def _submit(self, call, *args, **kwargs):
+        """Run a serial operation on the IO worker and wait for it."""
+        if self._closed:
+            raise DynamixelError("Controller is closed")
+        future = Future()
+        self._io_queue.put((call, args, kwargs, future))
+        try:
+            return future.result(timeout=5.0)
+        except FutureTimeout:
+            raise DynamixelError("Serial IO worker did not respond")
+
+    def _tune_serial_reads(self):
+        """Make status reads one blocking bulk read instead of a busy-poll.
+
+        The SDK opens the port non-blocking (timeout=0), so its rxPacket
+        loop spins calling read() and usually gets zero bytes back while
+        the status packet trickles in, costing a syscall per empty poll.
+        A short blocking timeout turns each read() into a single kernel
+        wait that returns as soon as the requested bytes are available;
+        the SDK's per-packet timeout still bounds the total wait. Reading
+        more than requested instead (read(in_waiting)) would drop bytes
+        between the per-status rxPacket calls of a sync read, so the
+        request size is left to the SDK.
+        """
+        try:
+            self.port_handler.ser.timeout = 0.002
+        except Exception:
+            pass
 
     # Read the data from the servos
 
     def _read1(self, dxl_id: int, addr: int) -> int:
-        with self.lock:
-            value, dxl_comm_result, dxl_error = self.packet_handler.read1ByteTxRx(
-                self.port_handler, dxl_id, addr
-            )
+        value, dxl_comm_result, dxl_error = self._submit(
+            self.packet_handler.read1ByteTxRx, self.port_handler, dxl_id, addr
+        )
         if dxl_comm_result != COMM_SUCCESS:
             raise DynamixelError(
                 f"Failed to read (ID {dxl_id}, addr {addr}): "
@@ -79,10 +326,9 @@ class DynamixelController:
         return value
 
     def _read2(self, dxl_id: int, addr: int) -> int:
-        with self.lock:
-            value, dxl_comm_result, dxl_error = self.packet_handler.read2ByteTxRx(
-                self.port_handler, dxl_id, addr
-            )
+        value, dxl_comm_result, dxl_error = self._submit(
+            self.packet_handler.read2ByteTxRx, self.port_handler, dxl_id, addr
+        )
         if dxl_comm_result != COMM_SUCCESS:
             raise DynamixelError(
                 f"Failed to read (ID {dxl_id}, addr {addr}): "
@@ -94,15 +340,12 @@ class DynamixelController:
                 f"{self.packet_handler.getRxPacketError(dxl_error)}"
             )
         # Handle signed 16-bit (for current, PWM)
-        if value & 0x8000:
-            value -= 0x10000
-        return value
+        return _to_int16(value)
 
     def _read4(self, dxl_id: int, addr: int) -> int:
-        with self.lock:
-            value, dxl_comm_result, dxl_error = self.packet_handler.read4ByteTxRx(
-                self.port_handler, dxl_id, addr
-            )
+        value, dxl_comm_result, dxl_error = self._submit(
+            self.packet_handler.read4ByteTxRx, self.port_handler, dxl_id, addr
+        )
         if dxl_comm_result != COMM_SUCCESS:
             raise DynamixelError(
                 f"Failed to read (ID {dxl_id}, addr {addr}): "
@@ -114,17 +357,15 @@ class DynamixelController:
                 f"{self.packet_handler.getRxPacketError(dxl_error)}"
             )
         # Handle signed 32-bit (for velocity, position)
-        if value & 0x80000000:
-            value -= 0x100000000
-        return value
+        return _to_int32(value)
 
     # Write commands to the servos
     
     def _write1(self, dxl_id: int, addr: int, value: int):
-        with self.lock:
-            dxl_comm_result, dxl_error = self.packet_handler.write1ByteTxRx(
-                self.port_handler, dxl_id, addr, value & 0xFF
-            )
+        dxl_comm_result, dxl_error = self._submit(
+            self.packet_handler.write1ByteTxRx,
+            self.port_handler, dxl_id, addr, value & 0xFF,
+        )
         if dxl_comm_result != COMM_SUCCESS:
             raise DynamixelError(
                 f"Failed to write (ID {dxl_id}, addr {addr}): "
@@ -137,10 +378,10 @@ class DynamixelController:
             )
 
     def _write2(self, dxl_id: int, addr: int, value: int):
-        with self.lock:
-            dxl_comm_result, dxl_error = self.packet_handler.write2ByteTxRx(
-                self.port_handler, dxl_id, addr, value & 0xFFFF
-            )
+        dxl_comm_result, dxl_error = self._submit(
+            self.packet_handler.write2ByteTxRx,
+            self.port_handler, dxl_id, addr, value & 0xFFFF,
+        )
         if dxl_comm_result != COMM_SUCCESS:
             raise DynamixelError(
                 f"Failed to write (ID {dxl_id}, addr {addr}): "
@@ -153,10 +394,28 @@ class DynamixelController:
             )
 
     def _write4(self, dxl_id: int, addr: int, value: int):
-        with self.lock:
-            dxl_comm_result, dxl_error = self.packet_handler.write4ByteTxRx(
-                self.port_handler, dxl_id, addr, value & 0xFFFFFFFF
+        dxl_comm_result, dxl_error = self._submit(
+            self.packet_handler.write4ByteTxRx,
+            self.port_handler, dxl_id, addr, value & 0xFFFFFFFF,
+        )
+        if dxl_comm_result != COMM_SUCCESS:
+            raise DynamixelError(
+                f"Failed to write (ID {dxl_id}, addr {addr}): "
+                f"{self.packet_handler.getTxRxResult(dxl_comm_result)}"
             )
+        if dxl_error != 0:
+            raise DynamixelError(
+                f"Failed to write (ID {dxl_id}, addr {addr}): "
+                f"{self.packet_handler.getRxPacketError(dxl_error)}"
+            )
+
+    def _write_bytes(self, dxl_id: int, addr: int, data: bytes):
+        # Protocol 2.0 Write takes an arbitrary contiguous payload, so
+        # adjacent registers can be updated in one round-trip.
+        dxl_comm_result, dxl_error = self._submit(
+            self.packet_handler.writeTxRx,
+            self.port_handler, dxl_id, addr, len(data), data,
+        )
         if dxl_comm_result != COMM_SUCCESS:
             raise DynamixelError(
                 f"Failed to write (ID {dxl_id}, addr {addr}): "
@@ -172,10 +431,9 @@ class DynamixelController:
 
     def get_model_number(self, dxl_id: int) -> int:
         """Ping servo and return model number."""
-        with self.lock:
-            model_number, dxl_comm_result, dxl_error = self.packet_handler.ping(
-                self.port_handler, dxl_id
-            )
+        model_number, dxl_comm_result, dxl_error = self._submit(
+            self.packet_handler.ping, self.port_handler, dxl_id
+        )
         if dxl_comm_result != COMM_SUCCESS:
             raise DynamixelError(
                 f"Ping failed (ID {dxl_id}): "
@@ -190,8 +448,13 @@ class DynamixelController:
 
     def set_torque(self, dxl_id: int, enable: bool):
         self._write1(dxl_id, ADDR_TORQUE_ENABLE, 1 if enable else 0)
+        self._torque_cache[dxl_id] = bool(enable)
 
     def set_operating_mode(self, dxl_id: int, mode: int, auto_torque: bool = True):
+        if auto_torque and self._mode_cache.get(dxl_id) == mode:
+            # Dashboard re-renders re-send the current mode; skip the
+            # torque-off / mode write / torque-on round-trips entirely.
+            return
         if auto_torque:
             # disable torque before mode change
             try:
@@ -200,6 +463,7 @@ class DynamixelController:
                 # ignore if already disabled
                 pass
         self._write1(dxl_id, ADDR_OPERATING_MODE, mode)
+        self._mode_cache[dxl_id] = mode
         if auto_torque:
             # re-enable torque
             self.set_torque(dxl_id, True)
@@ -213,6 +477,16 @@ class DynamixelController:
         velocity_p: Optional[int] = None,
         velocity_i: Optional[int] = None,
     ):
+        gains = (velocity_i, velocity_p, position_d, position_i, position_p)
+        if all(gain is not None for gain in gains):
+            # Addresses 76..85 are contiguous; one 10-byte write covers
+            # all five gains instead of five round-trips.
+            self._write_bytes(
+                dxl_id,
+                ADDR_VELOCITY_I_GAIN,
+                struct.pack("<5H", *(gain & 0xFFFF for gain in gains)),
+            )
+            return
         if position_p is not None:
             self._write2(dxl_id, ADDR_POSITION_P_GAIN, position_p)
         if position_i is not None:
@@ -224,6 +498,29 @@ class DynamixelController:
         if velocity_i is not None:
             self._write2(dxl_id, ADDR_VELOCITY_I_GAIN, velocity_i)
 
+    def set_position_pid_gains(
+        self, dxl_id: int, position_p: int, position_i: int, position_d: int
+    ):
+        """Write the position D/I/P gains (contiguous addrs 80..85) at once."""
+        self._write_bytes(
+            dxl_id,
+            ADDR_POSITION_D_GAIN,
+            struct.pack(
+                "<3H",
+                position_d & 0xFFFF,
+                position_i & 0xFFFF,
+                position_p & 0xFFFF,
+            ),
+        )
+
+    def set_velocity_pi_gains(self, dxl_id: int, velocity_p: int, velocity_i: int):
+        """Write the velocity I/P gains (contiguous addrs 76..79) at once."""
+        self._write_bytes(
+            dxl_id,
+            ADDR_VELOCITY_I_GAIN,
+            struct.pack("<2H", velocity_i & 0xFFFF, velocity_p & 0xFFFF),
+        )
+
     def set_goals(
         self,
         dxl_id: int,
@@ -234,51 +531,168 @@ class DynamixelController:
         profile_velocity: Optional[int] = None,
         profile_accel: Optional[int] = None,
     ):
-        if profile_accel is not None:
+        if profile_accel is not None and profile_velocity is not None:
+            # Profile Acceleration (108) and Profile Velocity (112) are
+            # contiguous; one 8-byte write covers both.
+            self._write_bytes(
+                dxl_id,
+                ADDR_PROFILE_ACCEL,
+                struct.pack(
+                    "<2I", profile_accel & 0xFFFFFFFF, profile_velocity & 0xFFFFFFFF
+                ),
+            )
+        elif profile_accel is not None:
             self._write4(dxl_id, ADDR_PROFILE_ACCEL, profile_accel)
-        if profile_velocity is not None:
+        elif profile_velocity is not None:
             self._write4(dxl_id, ADDR_PROFILE_VELOCITY, profile_velocity)
-        if goal_pwm is not None:
+        if goal_pwm is not None and goal_current is not None:
+            # Goal PWM (100) and Goal Current (102) are contiguous too.
+            self._write_bytes(
+                dxl_id,
+                ADDR_GOAL_PWM,
+                struct.pack("<2H", goal_pwm & 0xFFFF, goal_current & 0xFFFF),
+            )
+        elif goal_pwm is not None:
             self._write2(dxl_id, ADDR_GOAL_PWM, goal_pwm)
-        if goal_current is not None:
+        elif goal_current is not None:
             self._write2(dxl_id, ADDR_GOAL_CURRENT, goal_current)
         if goal_velocity is not None:
             self._write4(dxl_id, ADDR_GOAL_VELOCITY, goal_velocity)
         if goal_position is not None:
             self._write4(dxl_id, ADDR_GOAL_POSITION, goal_position)
 
+    def sync_set_goal_positions(self, goal_positions: Dict[int, int]):
+        """Write goal positions for several servos in one SyncWrite packet.
+
+        Intended for trajectory streaming, where per-servo _write4 calls
+        would cost one bus round-trip each; SyncWrite is a single
+        broadcast instruction with no status packets.
+        """
+        if not goal_positions:
+            return
+        dxl_comm_result = self._submit(self._sync_write_positions_io, goal_positions)
+        if dxl_comm_result != COMM_SUCCESS:
+            raise DynamixelError(
+                f"Sync write failed: "
+                f"{self.packet_handler.getTxRxResult(dxl_comm_result)}"
+            )
+
+    def _sync_write_positions_io(self, goal_positions: Dict[int, int]) -> int:
+        """Assemble and send one SyncWrite packet; runs on the IO worker."""
+        self.sync_write.clearParam()
+        for dxl_id, position in goal_positions.items():
+            self.sync_write.addParam(dxl_id, _UINT32.pack(position & 0xFFFFFFFF))
+        dxl_comm_result = self.sync_write.txPacket()
+        self.sync_write.clearParam()
+        return dxl_comm_result
+
     # Read Telemtry
-    def read_state(self, dxl_id: int) -> Dict[str, Any]:
+
+    def _sync_read_tick(self):
+        """Fetch the telemetry block of every servo in one bus transaction."""
+        dxl_comm_result = self._submit(self.sync_read.txRxPacket)
+        if dxl_comm_result != COMM_SUCCESS:
+            raise DynamixelError(
+                f"Sync read failed: "
+                f"{self.packet_handler.getTxRxResult(dxl_comm_result)}"
+            )
+
+    def _state_from_sync_read(self, dxl_id: int) -> Dict[str, Any]:
+        """Build the state dict for one servo from the last sync read."""
         state: Dict[str, Any] = {}
+        if not self.sync_read.isAvailable(dxl_id, SYNC_READ_START, SYNC_READ_LENGTH):
+            state["error"] = f"No sync read data for ID {dxl_id}"
+            return state
+        # One unpack of the raw 14-byte block handles widths and
+        # signedness for every field at once.
+        moving, _, pwm, current, velocity, position = _TELEM_BLOCK.unpack(
+            bytes(self.sync_read.data_dict[dxl_id])
+        )
+        mode = self._mode_cache.get(dxl_id, 0)
+        state["operating_mode"] = mode
+        state["torque_enabled"] = self._torque_cache.get(dxl_id, False)
+        state["present_pwm"] = pwm
+        state["present_current"] = current
+        state["present_velocity"] = velocity
+        state["present_position"] = position
+        state["moving"] = bool(moving)
+        state["operating_mode_name"] = self._mode_name(mode)
+        return state
+
+    def _mode_name(self, mode: int) -> str:
+        name = self._mode_name_cache.get(mode)
+        if name is None:
+            name = OPERATING_MODE_NAMES.get(mode, f"Mode {mode}")
+            self._mode_name_cache[mode] = name
+        return name
+
+    def read_state(self, dxl_id: int) -> Dict[str, Any]:
         try:
-            state["operating_mode"] = self._read1(dxl_id, ADDR_OPERATING_MODE)
-            state["torque_enabled"] = bool(self._read1(dxl_id, ADDR_TORQUE_ENABLE))
-            state["present_pwm"] = self._read2(dxl_id, ADDR_PRESENT_PWM)
-            state["present_current"] = self._read2(dxl_id, ADDR_PRESENT_CURRENT)
-            state["present_velocity"] = self._read4(dxl_id, ADDR_PRESENT_VELOCITY)
-            state["present_position"] = self._read4(dxl_id, ADDR_PRESENT_POSITION)
-            state["moving"] = bool(self._read1(dxl_id, ADDR_MOVING))
-            mode = state.get("operating_mode", 0)
-            state["operating_mode_name"] = OPERATING_MODE_NAMES.get(mode, f"Mode {mode}")
+            self._sync_read_tick()
         except DynamixelError as exc:
-            state["error"] = str(exc)
-        return state
+            return {"error": str(exc)}
+        return self._state_from_sync_read(dxl_id)
 
     def read_all(self) -> Dict[int, Dict[str, Any]]:
         result: Dict[int, Dict[str, Any]] = {}
+        try:
+            self._sync_read_tick()
+        except DynamixelError as exc:
+            message = str(exc)
+            return {dxl_id: {"error": message} for dxl_id in self.ids}
         for dxl_id in self.ids:
-            result[dxl_id] = self.read_state(dxl_id)
+            result[dxl_id] = self._state_from_sync_read(dxl_id)
         return result
 
-    def read_all_states(self) -> Dict[int, Dict[str, Any]]:
-        return self.read_all()
+    def read_all_states(self) -> Dict[str, Any]:
+        """Read telemetry for every servo as struct-of-arrays buffers.
+
+        Returns one packed little-endian buffer per field, indexed by servo
+        slot; "ids" maps each slot to its servo ID and "ok" flags slots
+        whose servo answered the sync read.
+        """
+        try:
+            self._sync_read_tick()
+        except DynamixelError as exc:
+            return {"ids": list(self.ids), "error": str(exc)}
+        sync_read = self.sync_read
+        for i, dxl_id in enumerate(self.ids):
+            if not sync_read.isAvailable(dxl_id, SYNC_READ_START, SYNC_READ_LENGTH):
+                self._ok_buf[i] = 0
+                continue
+            self._ok_buf[i] = 1
+            # The sync read block is already raw little-endian bytes in
+            # field order; copy the slices straight into the buffers.
+            buf = sync_read.data_dict[dxl_id]
+            self._pwm_buf[2 * i:2 * i + 2] = buf[2:4]
+            self._cur_buf[2 * i:2 * i + 2] = buf[4:6]
+            self._vel_buf[4 * i:4 * i + 4] = buf[6:10]
+            self._pos_buf[4 * i:4 * i + 4] = buf[10:14]
+            self._moving_buf[i] = 1 if buf[0] else 0
+            self._mode_buf[i] = self._mode_cache.get(dxl_id, 0) & 0xFF
+            self._torque_buf[i] = 1 if self._torque_cache.get(dxl_id) else 0
+        return {
+            "ids": list(self.ids),
+            "ok": bytes(self._ok_buf),
+            "pos": bytes(self._pos_buf),
+            "vel": bytes(self._vel_buf),
+            "cur": bytes(self._cur_buf),
+            "pwm": bytes(self._pwm_buf),
+            "moving": bytes(self._moving_buf),
+            "mode": bytes(self._mode_buf),
+            "torque": bytes(self._torque_buf),
+        }
 
     def close(self):
-        with self.lock:
-            if self.port_handler is not None:
-                try:
-                    self.port_handler.closePort()
-                except Exception:
-                    pass
-                finally:
-                    print(f"[INFO] Closed Dynamixel port {self.port_name}")
+        # Stop the IO worker before touching the port so no operation is
+        # mid-transaction when it closes.
+        self._closed = True
+        self._io_queue.put(None)
+        self._io_thread.join(timeout=2.0)
+        if self.port_handler is not None:
+            try:
+                self.port_handler.closePort()
+            except Exception:
+                pass
+            finally:
+                logger.info("Closed Dynamixel port %s", self.port_name)
@@ -5,6 +5,16 @@ const RPM_PER_UNIT = 0.229;
 const PERCENT_PER_PWM_UNIT = 0.113;
 const MA_PER_CURRENT_UNIT = 1.0;
 
+// Mirrors OPERATING_MODE_NAMES in dynamixel_controller.py
+const OPERATING_MODE_NAMES = {
+  0: "Current Control Mode",
+  1: "Velocity Control Mode",
+  3: "Position Control Mode",
+  4: "Extended Position Control Mode",
+  5: "Current-based Position Mode",
+  16: "PWM Control Mode",
+};
+
 // Socket.IO instance (
 let socket = null;
 
@@ -251,13 +261,124 @@ function updateChart(chart, tLabel, value) {
   chart.update("none");
 }
 
+// Minimal MessagePack decoder covering the types the backend emits
+// (maps, arrays, strings, binary, ints, floats, bool, nil).
+function msgpackDecode(u8) {
+  let off = 0;
+  const view = new DataView(u8.buffer, u8.byteOffset, u8.byteLength);
+  const utf8 = new TextDecoder();
+
+  const readStr = (len) => {
+    const s = utf8.decode(u8.subarray(off, off + len));
+    off += len;
+    return s;
+  };
+  const readBin = (len) => {
+    const b = u8.slice(off, off + len);
+    off += len;
+    return b;
+  };
+  const readArray = (n) => {
+    const a = new Array(n);
+    for (let i = 0; i < n; i++) a[i] = decode();
+    return a;
+  };
+  const readMap = (n) => {
+    const m = {};
+    for (let i = 0; i < n; i++) {
+      const k = decode();
+      m[k] = decode();
+    }
+    return m;
+  };
+
+  function decode() {
+    const b = u8[off++];
+    if (b < 0x80) return b; // positive fixint
+    if (b >= 0xe0) return b - 0x100; // negative fixint
+    // 0xc0-0xdf are the typed codes handled by the switch below; only
+    // 0x80-0xbf are the fix-family prefixes.
+    if (b >= 0xa0 && b < 0xc0) return readStr(b & 0x1f); // fixstr
+    if (b >= 0x90 && b < 0xa0) return readArray(b & 0x0f); // fixarray
+    if (b < 0x90) return readMap(b & 0x0f); // fixmap
+    let n;
+    switch (b) {
+      case 0xc0: return null;
+      case 0xc2: return false;
+      case 0xc3: return true;
+      case 0xc4: n = view.getUint8(off); off += 1; return readBin(n);
+      case 0xc5: n = view.getUint16(off); off += 2; return readBin(n);
+      case 0xc6: n = view.getUint32(off); off += 4; return readBin(n);
+      case 0xca: n = view.getFloat32(off); off += 4; return n;
+      case 0xcb: n = view.getFloat64(off); off += 8; return n;
+      case 0xcc: n = view.getUint8(off); off += 1; return n;
+      case 0xcd: n = view.getUint16(off); off += 2; return n;
+      case 0xce: n = view.getUint32(off); off += 4; return n;
+      case 0xcf: n = Number(view.getBigUint64(off)); off += 8; return n;
+      case 0xd0: n = view.getInt8(off); off += 1; return n;
+      case 0xd1: n = view.getInt16(off); off += 2; return n;
+      case 0xd2: n = view.getInt32(off); off += 4; return n;
+      case 0xd3: n = Number(view.getBigInt64(off)); off += 8; return n;
+      case 0xd9: n = view.getUint8(off); off += 1; return readStr(n);
+      case 0xda: n = view.getUint16(off); off += 2; return readStr(n);
+      case 0xdb: n = view.getUint32(off); off += 4; return readStr(n);
+      case 0xdc: n = view.getUint16(off); off += 2; return readArray(n);
+      case 0xdd: n = view.getUint32(off); off += 4; return readArray(n);
+      case 0xde: n = view.getUint16(off); off += 2; return readMap(n);
+      case 0xdf: n = view.getUint32(off); off += 4; return readMap(n);
+      default:
+        throw new Error("msgpack: unsupported type 0x" + b.toString(16));
+    }
+  }
+
+  return decode();
+}
+
+// Expand the struct-of-arrays telemetry sent by the backend (one packed
+// little-endian buffer per field, indexed by servo slot) into the per-ID
+// objects the render path expects.
+function soaToServos(soa) {
+  const servos = {};
+  const ids = soa.ids || [];
+  if (soa.error) {
+    ids.forEach((id) => {
+      servos[id] = { error: soa.error };
+    });
+    return servos;
+  }
+  const dv = (b) => new DataView(b.buffer, b.byteOffset, b.byteLength);
+  const pos = dv(soa.pos);
+  const vel = dv(soa.vel);
+  const cur = dv(soa.cur);
+  const pwm = dv(soa.pwm);
+  ids.forEach((id, i) => {
+    if (soa.ok && !soa.ok[i]) {
+      servos[id] = { error: `No sync read data for ID ${id}` };
+      return;
+    }
+    const mode = soa.mode[i];
+    servos[id] = {
+      present_position: pos.getInt32(4 * i, true),
+      present_velocity: vel.getInt32(4 * i, true),
+      present_current: cur.getInt16(2 * i, true),
+      present_pwm: pwm.getInt16(2 * i, true),
+      moving: !!soa.moving[i],
+      torque_enabled: !!soa.torque[i],
+      operating_mode: mode,
+      operating_mode_name: OPERATING_MODE_NAMES[mode] || `Mode ${mode}`,
+    };
+  });
+  return servos;
+}
+
 function setupTelemetryHandlers() {
   if (!socket) return;
 
-  socket.on("telemetry", (payload) => {
-    const timestamp = payload.timestamp || Date.now() / 1000;
+  const renderSample = (timestamp, servos) => {
+    if (servos && servos.ids) {
+      servos = soaToServos(servos);
+    }
     const tLabel = new Date(timestamp * 1000).toLocaleTimeString();
-    const servos = payload.servos || {};
 
     Object.keys(servos).forEach((idStr) => {
       const id = parseInt(idStr, 10);
@@ -313,6 +434,24 @@ function setupTelemetryHandlers() {
         updateChart(charts[id].vel, tLabel, velRpm);
       }
     });
+  };
+
+  // Legacy per-tick JSON telemetry (fallback when msgpack is unavailable
+  // on the backend).
+  socket.on("telemetry", (payload) => {
+    renderSample(payload.timestamp || Date.now() / 1000, payload.servos || {});
+  });
+
+  // Batched binary telemetry: one msgpack message carrying several samples.
+  socket.on("telemetry_batch", (buf) => {
+    let samples;
+    try {
+      samples = msgpackDecode(new Uint8Array(buf));
+    } catch (err) {
+      console.error("Failed to decode telemetry batch:", err);
+      return;
+    }
+    samples.forEach((sample) => renderSample(sample.t, sample.s || {}));
   });
 }
 
@@ -1,27 +1,56 @@
 # save as make_qr.py
-import sys
+import argparse
 import qrcode
 
-def main():
-    if len(sys.argv) < 2:
-        print("Usage: python make_qr.py <link> [output.png]")
-        raise SystemExit(1)
+EC_LEVELS = {
+    "L": qrcode.constants.ERROR_CORRECT_L,
+    "M": qrcode.constants.ERROR_CORRECT_M,
+    "Q": qrcode.constants.ERROR_CORRECT_Q,
+    "H": qrcode.constants.ERROR_CORRECT_H,
+}
+
 
-    link = sys.argv[1]
-    out_file = sys.argv[2] if len(sys.argv) >= 3 else "qr.png"
+def main():
+    parser = argparse.ArgumentParser(description="Generate a QR code PNG for a link.")
+    parser.add_argument("link", help="URL to encode")
+    parser.add_argument("output", nargs="?", default="qr.png", help="output PNG path")
+    parser.add_argument(
+        "--version",
+        type=int,
+        choices=range(1, 41),
+        metavar="1-40",
+        default=None,
+        help="QR version; when given, skips the best-fit search over all "
+        "40 versions (typical LAN URLs fit version 2)",
+    )
+    parser.add_argument(
+        "--ec",
+        choices=EC_LEVELS,
+        default="M",
+        help="error correction level (default: M)",
+    )
+    args = parser.parse_args()
 
     qr = qrcode.QRCode(
-        version=None,
-        error_correction=qrcode.constants.ERROR_CORRECT_M,
+        version=args.version,
+        error_correction=EC_LEVELS[args.ec],
         box_size=10,
         border=4,
     )
-    qr.add_data(link)
-    qr.make(fit=True)
+    qr.add_data(args.link)
+    # fit=True tries versions 1..40 and computes masks for each; only
+    # search when the caller did not pin a version.
+    qr.make(fit=args.version is None)
 
     img = qr.make_image(fill_color="black", back_color="white")
-    img.save(out_file)
-    print(f"Saved QR code to: {out_file}")
+    # Black-on-white renders as 1 bpp already; force it in case the
+    # image factory returned RGB, halving what PNG compression chews on.
+    pil_img = img.get_image() if hasattr(img, "get_image") else img
+    if pil_img.mode != "1":
+        pil_img = pil_img.convert("1")
+    pil_img.save(args.output)
+    print(f"Saved QR code to: {args.output}")
+
 
 if __name__ == "__main__":
     main()